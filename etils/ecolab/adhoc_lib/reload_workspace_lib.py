@@ -40,6 +40,9 @@ if typing.TYPE_CHECKING:
 
 _SKIP_RELOAD = 'etils'
 
+# Internal IPython variables (`_`, `__`, `_12`)
+_IPYTHON_INTERNAL_NAME_RE = re.compile(r'_+(\d+)?')
+
 
 def reload_workspace(
     source: g3_utils.Source | None = None,
@@ -290,23 +293,32 @@ def update_global_namespace(
   # with ecolab.adhoc():
   #   import module  # < globals() not modified, difficult to detect
   #
+  # Bind hot names as locals: the loop runs once per user global, so each
+  # attribute resolution inside it is paid per-entry.
+  module_type = types.ModuleType
+  getattr_static = inspect.getattr_static
+  is_internal_name = _IPYTHON_INTERNAL_NAME_RE.fullmatch
+  sys_modules = sys.modules
+
   for name, module in dict(user_ns).items():
     # We look at all globals, not just the ones defined inside the
     # contextmanager.
     # The solution would be to mock `__import__` to capture all statements
     # but over-engineered for now.
-    if not isinstance(module, types.ModuleType):
+    # Keep `isinstance` (not an exact type check): `lazy_imports` modules are
+    # `ModuleType` sub-classes.
+    if not isinstance(module, module_type):
       continue  # The object is not a module
 
     # `getattr_static` for `lazy_imports` modules
-    module_name = inspect.getattr_static(module, '__name__', None)
+    module_name = getattr_static(module, '__name__', None)
     if module_name not in reload:
       continue  # The module not reloaded
-    if re.fullmatch(r'_+(\d+)?', name):
+    if is_internal_name(name):
       continue  # Internal IPython variables (`_`, `__`, `_12`)
 
     if verbose:
       print(f'Overwrting Colab global {name!r} to new module ({module_name!r})')
 
-    reloaded_module = sys.modules[module_name]
+    reloaded_module = sys_modules[module_name]
     user_ns[name] = reloaded_module
@@ -16,10 +16,12 @@
 
 from __future__ import annotations
 
+import collections
+import concurrent.futures
 import functools
 import importlib
-import inspect
 import sys
+import types
 
 from etils import epath
 from etils.ecolab import adhoc_imports
@@ -27,6 +29,10 @@ from etils.ecolab import ip_utils
 from etils.ecolab.adhoc_lib import reload_workspace_lib
 from etils.epy.adhoc_utils import module_utils
 
+# Below this many modules, thread dispatch costs more than the `stat` overlap
+# saves.
+_MIN_MODULES_FOR_PARALLEL_STAT = 8
+
 
 def _create_module_graph(nodes: set[str]) -> dict[str, set[str]]:
   graph = {}
@@ -34,52 +40,51 @@ def _create_module_graph(nodes: set[str]) -> dict[str, set[str]]:
   for source in nodes:
     deps = set()
     for val in sys.modules[source].__dict__.values():
-      if inspect.ismodule(val) and val.__name__ in nodes:
+      # Exact type check (C-level pointer compare) rather than
+      # `inspect.ismodule`: the `__dict__` scan is the hot loop here and
+      # module sub-classes are not valid graph nodes anyway.
+      if type(val) is types.ModuleType and val.__name__ in nodes:  # pylint: disable=unidiomatic-typecheck
         deps.add(val.__name__)
     graph[source] = deps
 
   return graph
 
 
-class _ModuleSearch:
-  """Graph of module dependencies that can be queried."""
-
-  def __init__(self, targets: set[str], graph: dict[str, set[str]]):
-    self._graph = graph
-    self._cache: dict[str, bool] = {}
-    self._targets = targets
-
-  def _reaches_targets(self, source: str) -> bool:
-    """Check if a module references other modules directly or indirectly."""
-    queue = [source]
-    visited = set(queue)
+def _reverse_graph(graph: dict[str, set[str]]) -> dict[str, list[str]]:
+  """Invert the `module -> deps` edges into `dep -> dependent modules`."""
+  rgraph = collections.defaultdict(list)
+  for source, deps in graph.items():
+    for dep in deps:
+      rgraph[dep].append(source)
+  return rgraph
 
-    while queue:
-      m = queue.pop(0)
 
-      if (reaches := self._cache.get(m)) is not None:
-        if reaches:
-          # If m is known to reach target -> source reaches targets
-          return True
-        else:
-          # Otherwise, no need to search the neighbours of this node either.
-          continue
+def _reachable_from(
+    targets: set[str],
+    rgraph: dict[str, list[str]],
+) -> set[str]:
+  """Returns all nodes which can reach one of `targets`.
 
-      if m in self._targets:
-        return True
+  A module reaches a target exactly when it is reachable from the targets in
+  the reversed graph, so a single multi-source BFS answers the query for all
+  modules at once (instead of one BFS per module).
 
-      for neighbour in self._graph.get(m, set()):
-        if neighbour not in visited:
-          visited.add(neighbour)
-          queue.append(neighbour)
+  Args:
+    targets: The BFS starting nodes (e.g. the dirty modules)
+    rgraph: The reversed dependency graph (from `_reverse_graph`)
 
-    return False
-
-  def reaches_targets(self, source: str) -> bool:
-    """Check if a module references other modules directly or indirectly."""
-    ret = self._reaches_targets(source)
-    self._cache[source] = ret
-    return ret
+  Returns:
+    All nodes which can reach one of `targets` (including the targets).
+  """
+  visited = set(targets)
+  queue = collections.deque(targets)
+  while queue:
+    node = queue.popleft()
+    for neighbour in rgraph.get(node, ()):
+      if neighbour not in visited:
+        visited.add(neighbour)
+        queue.append(neighbour)
+  return visited
 
 
 class ModuleReloader:
@@ -87,32 +92,66 @@ class ModuleReloader:
 
   def __init__(self, **adhoc_kwargs):
     self.adhoc_kwargs = adhoc_kwargs
+    # Materialized eagerly: read on every cell execution (prefix matching),
+    # so a plain attribute beats the cached_property descriptor protocol.
+    self._reload_prefixes: tuple[str, ...] = tuple(adhoc_kwargs['reload'])
     self._last_updates: dict[str, int | None] = {}
 
-  @functools.cached_property
+  @property
   def reload(self) -> tuple[str, ...]:
-    return tuple(self.adhoc_kwargs['reload'])
+    return self._reload_prefixes
 
   @property
   def verbose(self) -> bool:
     return self.adhoc_kwargs['verbose']
 
+  @functools.cached_property
+  def _stat_pool(self) -> concurrent.futures.ThreadPoolExecutor:
+    # Kept alive across cells to avoid re-spawning threads per execution.
+    return concurrent.futures.ThreadPoolExecutor(
+        max_workers=16,
+        thread_name_prefix='etils_autoreload_stat',
+    )
+
+  def _get_last_updates(self, module_names: list[str]) -> list[int | None]:
+    """Stat all module files, overlapping the I/O for large reload sets.
+
+    Each `stat` can be a network round-trip on remote filesystems, so for
+    large reload sets the calls are dispatched on a thread pool (`os.stat`
+    releases the GIL).
+
+    Args:
+      module_names: Modules to stat.
+
+    Returns:
+      The last update time of each module (aligned with `module_names`).
+    """
+    if len(module_names) <= _MIN_MODULES_FOR_PARALLEL_STAT:
+      return [_get_last_module_update(m) for m in module_names]
+    return list(self._stat_pool.map(_get_last_module_update, module_names))
+
   def register(self) -> None:
-    if not self.reload:
+    if not self._reload_prefixes:
       raise ValueError('`cell_autoreload=True` require to set `reload=`')
 
     # Keep a value for each module. If a file is updated, trigger a reload.
-    for module in module_utils.get_module_names(self.reload):
-      self._last_updates[module] = _get_last_module_update(module)
+    module_names = module_utils.get_module_names(self._reload_prefixes)
+    self._last_updates.update(
+        zip(module_names, self._get_last_updates(module_names))
+    )
 
     # Currently, only a single auto-reload can be set at the time.
     # Probably a good idea as it's unclear how to differentiate between
     # registering 2 cell_autoreload and overwriting cell_autoreload params.
+    # Cannot use `self.method` directly because bound methods do not support
+    # set attribute (required by `register_once`). A plain closure does, and
+    # avoids the `functools.partial` call overhead in the per-cell hook.
+    def _pre_run_cell(*args) -> None:
+      self._pre_run_cell_maybe_reload(*args)
+
     ip_utils.register_once(
         'pre_run_cell',
-        # Cannot use `self.method` because bound methods do not support
-        # set attribute.
-        functools.partial(type(self)._pre_run_cell_maybe_reload, self),
+        _pre_run_cell,
         'is_cell_auto_reload',
     )
 
@@ -127,29 +166,39 @@ class ModuleReloader:
 
     # If any of the modules has been updated, trigger a reload
 
+    # Single `sys.modules` scan, reused for the mtime check and `reload_set`.
+    module_names = module_utils.get_module_names(self._reload_prefixes)
+
     # Find which modules are dirty.
-    dirty_modules: set[str] = set()
-    for module in module_utils.get_module_names(self.reload):
-      prev_mtime = self._last_updates.get(module)
-      new_mtime = _get_last_module_update(module)
-      if prev_mtime is None or (
-          new_mtime is not None and new_mtime > prev_mtime
-      ):
-        dirty_modules.add(module)
-      self._last_updates[module] = new_mtime
+    new_mtimes = self._get_last_updates(module_names)
+    last_updates_get = self._last_updates.get
+    dirty_modules: set[str] = {
+        module
+        for module, new_mtime in zip(module_names, new_mtimes)
+        if (prev_mtime := last_updates_get(module)) is None
+        or (new_mtime is not None and new_mtime > prev_mtime)
+    }
+    # Single bulk (C-level) update rather than one store per module.
+    self._last_updates.update(zip(module_names, new_mtimes))
 
     if not dirty_modules:
       return
 
     # Get set of all modules we could potentially reload.
-    reload_set = set(module_utils.get_module_names(self.reload))
-    graph = _create_module_graph(reload_set)
-    search = _ModuleSearch(dirty_modules, graph)
-
-    # Narrow it down to modules that are dirty or reference a dirty module.
-    modules_to_reload = [
-        mod for mod in reload_set if search.reaches_targets(mod)
-    ]
+    reload_set = set(module_names)
+    if dirty_modules == reload_set:
+      # Everything is dirty (e.g. first edit after registering): the
+      # reachability analysis could only answer "all of them".
+      modules_to_reload = list(reload_set)
+    else:
+      # Rebuilt on every edit-cell: reloads mutate module `__dict__`s (new
+      # imports add edges), so a cached graph would go stale exactly when it
+      # would be reused. Clean cells never reach this point anyway.
+      graph = _create_module_graph(reload_set)
+      reaches_dirty = _reachable_from(dirty_modules, _reverse_graph(graph))
+
+      # Narrow it down to modules that are dirty or reference a dirty module.
+      modules_to_reload = [mod for mod in reload_set if mod in reaches_dirty]
 
     # Only reload exactly the modules we know are dirty. reload_recursive
     # is an undocumented flag in adhoc for now.
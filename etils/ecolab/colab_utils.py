@@ -34,6 +34,57 @@ if typing.TYPE_CHECKING:
 
 _T = TypeVar('_T')
 
+# Static CSS/HTML for `json()`, built once rather than per call.
+_JSON_CSS = """
+  json-viewer {
+    padding:1px 1.5em 1px 1.5em;
+    --background-color: #f7f7f7;
+    --property-color: #087db2;
+    --string-color: #a31515;
+    --number-color: #008000;
+    --boolean-color: #0000ff;
+    --null-color: #af00db;
+    --preview-color: #888888;
+  }
+  json-viewer::part(key) {
+    margin-right: 0.5em;
+  }
+  html[theme=dark] json-viewer {
+    --background-color: #2c2c2c;
+    --property-color: #6fb3d2;
+    --string-color: #ce9178;
+    --number-color: #b5cea8;
+    --boolean-color: #569cd6;
+    --null-color: #c586c0;
+    --preview-color: #888888;
+  }
+  .ecolab-json button {
+      background-color: var(--colab-highlighted-surface-color);
+      color: var(--colab-primary-text-color);
+      border-width: 0;
+  }
+  .ecolab-json input {
+      border-color: var(--colab-highlighted-surface-color);
+  }
+"""
+
+_JSON_HTML_TEMPLATE = """
+  <script src="https://unpkg.com/@alenaksu/json-viewer@2.0.0/dist/json-viewer.bundle.js"></script>
+  <script>
+    const viewer{id} = document.querySelector('#json{id}');
+    {expand_line}
+  </script>
+  <style>
+  {css}
+  </style>
+  <div class="ecolab-json">
+    <button onclick="viewer{id}.expandAll();">Expand All</button>
+    <button onclick="viewer{id}.collapseAll();">Collapse All</button>
+    <input placeholder="Filter Regex" onkeyup="viewer{id}.filter(RegExp(this.value, 'i'));"></input>
+    <json-viewer id="json{id}">{payload}</json-viewer>
+  </div>
+"""
+
 
 @contextlib.contextmanager
 def collapse(name: str = '', *, expanded: bool = False) -> Iterator[None]:
@@ -95,58 +146,19 @@ def json(value: Json, expanded: bool = False) -> None:
   # in other alternatives).
   # https://github.com/mac-s-g/react-json-view/issues/237
 
-  css_content = """
-  json-viewer {
-    padding:1px 1.5em 1px 1.5em;
-    --background-color: #f7f7f7;
-    --property-color: #087db2;
-    --string-color: #a31515;
-    --number-color: #008000;
-    --boolean-color: #0000ff;
-    --null-color: #af00db;
-    --preview-color: #888888;
-  }
-  json-viewer::part(key) {
-    margin-right: 0.5em;
-  }
-  html[theme=dark] json-viewer {
-    --background-color: #2c2c2c;
-    --property-color: #6fb3d2;
-    --string-color: #ce9178;
-    --number-color: #b5cea8;
-    --boolean-color: #569cd6;
-    --null-color: #c586c0;
-    --preview-color: #888888;
-  }
-  .ecolab-json button {
-      background-color: var(--colab-highlighted-surface-color);
-      color: var(--colab-primary-text-color);
-      border-width: 0;
-  }
-  .ecolab-json input {
-      border-color: var(--colab-highlighted-surface-color);
-  }
-  """
-
-  html_content = html.escape(json_std.dumps(value))
+  # Compact separators: the payload is only machine-parsed, so the extra
+  # whitespace is pure escape/transfer overhead (~20% on large dicts).
+  payload = html.escape(
+      json_std.dumps(value, separators=(',', ':'), ensure_ascii=False)
+  )
   # if expanded is True, call viewer.expandAll()
   expand_line = f'viewer{id_}.expandAll();\n' if expanded else ''
-  html_content = f"""
-  <script src="https://unpkg.com/@alenaksu/json-viewer@2.0.0/dist/json-viewer.bundle.js"></script>
-  <script>
-    const viewer{id_} = document.querySelector('#json{id_}');
-    {expand_line}
-  </script>
-  <style>
-  {css_content}
-  </style>
-  <div class="ecolab-json">
-    <button onclick="viewer{id_}.expandAll();">Expand All</button>
-    <button onclick="viewer{id_}.collapseAll();">Collapse All</button>
-    <input placeholder="Filter Regex" onkeyup="viewer{id_}.filter(RegExp(this.value, 'i'));"></input>
-    <json-viewer id="json{id_}">{html_content}</json-viewer>
-  </div>
-  """
+  html_content = _JSON_HTML_TEMPLATE.format(
+      id=id_,
+      css=_JSON_CSS,
+      expand_line=expand_line,
+      payload=payload,
+  )
   IPython.display.display(IPython.display.HTML(html_content))
 
 
@@ -23,6 +23,7 @@ import enum
 import functools
 import gc
 import inspect
+import os
 import sys
 import time
 import types
@@ -69,11 +70,33 @@ class _ObjectUpdater:
 
   def __init__(self):
     self._type_updates: dict[type, type] = {}  # pylint: disable=g-bare-generic
+    # Exact-type dispatch for the common cases (plain classes, functions,
+    # methods, properties). `update` runs once per attribute of every class
+    # of every reloaded module, so a single dict lookup beats the chain of
+    # isinstance checks in the `match` below. Objects with custom metaclasses
+    # or sub-classed types fall through to the `match` statement.
+    self._exact_update_rules = {
+        enum.EnumType: self._update_enum,
+        type: self._update_class,
+        types.FunctionType: self._update_function,
+        types.MethodType: self._update_method,
+        property: self._update_property,
+    }
 
   def _update_class(self, old: type, new: type):  # pylint: disable=g-bare-generic
     """Update the class."""
     self._type_updates[old] = new
 
+    # Fast path: both classes hold exactly the same member objects (e.g. the
+    # class was already processed through another module alias), so the
+    # per-attribute recursion and setattr would all be no-ops. Identity is
+    # used rather than code equality: freshly recompiled members always need
+    # the update (their `__globals__` still point to the new module).
+    old_fingerprint = {k: id(v) for k, v in old.__dict__.items()}
+    new_fingerprint = {k: id(v) for k, v in new.__dict__.items()}
+    if old_fingerprint == new_fingerprint:
+      return
+
     for key in list(old.__dict__.keys()):
       old_obj = getattr(old, key)
 
@@ -132,6 +155,10 @@ class _ObjectUpdater:
       except (AttributeError, TypeError, ValueError):
         pass
 
+  def _update_method(self, old: types.MethodType, new: types.MethodType):
+    """Upgrade the underlying function of a bound method."""
+    self._update_function(old.__func__, new.__func__)  # pytype: disable=wrong-arg-types
+
   def _update_property(self, old: property, new: property):
     """Replace get/set/del functions of a property."""
     self._update_function(old.fdel, new.fdel)
@@ -144,6 +171,11 @@ class _ObjectUpdater:
     if old is new:
       return
 
+    # Fast path: exact type match on both sides.
+    if type(old) is type(new):
+      if (update_fn := self._exact_update_rules.get(type(old))) is not None:
+        return update_fn(old, new)
+
     match old, new:
       case enum.EnumType(), enum.EnumType():
         return self._update_enum(old, new)
@@ -152,7 +184,7 @@ class _ObjectUpdater:
       case types.FunctionType(), types.FunctionType():
         return self._update_function(old, new)
       case types.MethodType(), types.MethodType():
-        return self._update_function(old.__func__, new.__func__)  # pytype: disable=wrong-arg-types
+        return self._update_method(old, new)
       case property(), property():
         return self._update_property(old, new)
 
@@ -161,26 +193,34 @@ class _ObjectUpdater:
     if len(self._type_updates) == 0:  # pylint: disable=g-explicit-length-test
       return
 
-    refs = gc.get_referrers(*self._type_updates.keys())
-    for ref in refs:
-      if (new := self._type_updates.get(type(ref))) is not None:
-        object.__setattr__(ref, "__class__", new)
+    # Note: A per-class weak instance registry (populated from a patched
+    # `__init__`) would avoid the heap walk entirely, but it cannot see
+    # instances created before the class was first tracked, so it would
+    # silently skip remapping them. A single batched sweep over all updated
+    # classes is the cheapest *sound* option.
+    # `id()`-keyed lookup: one flat pass over the heap with a pointer-compare
+    # dict hit per object, instead of resolving referrers of every old class.
+    migrations = {id(old): new for old, new in self._type_updates.items()}
+    migrations_get = migrations.get
+    for obj in gc.get_objects():
+      if (new := migrations_get(id(type(obj)))) is not None:
+        object.__setattr__(obj, "__class__", new)
 
 
 @dataclasses.dataclass(frozen=True)
 class _ModuleRefs:
   """Reference on the previous module/object instances."""
 
-  modules: list[weakref.ref[types.ModuleType]] = dataclasses.field(
-      default_factory=list
+  modules: weakref.WeakSet[types.ModuleType] = dataclasses.field(
+      default_factory=weakref.WeakSet
   )
-  objs: dict[str, list[weakref.ref[Any]]] = dataclasses.field(
-      default_factory=lambda: collections.defaultdict(list)
+  objs: dict[str, weakref.WeakSet[Any]] = dataclasses.field(
+      default_factory=lambda: collections.defaultdict(weakref.WeakSet)
   )
 
   def save_module(self, module: types.ModuleType) -> None:
     """Save reference on all previous modules/objects."""
-    self.modules.append(weakref.ref(module))
+    self.modules.add(module)
 
     for name, old_obj in module.__dict__.items():
       # Only update objects part of the module (filter other imported symbols)
@@ -189,7 +229,7 @@ class _ModuleRefs:
       ):
         continue
 
-      self.objs[name].append(weakref.ref(old_obj))
+      self.objs[name].add(old_obj)
 
   def update_refs_with_new_module(
       self,
@@ -199,43 +239,32 @@ class _ModuleRefs:
       verbose: bool = False,
   ) -> _ModuleRefs:
     """Update all old reference to previous objects."""
-    # Resolve all weakrefs
-    modules = [m for mod in self.modules if (m := mod())]
+    # Dead refs are auto-pruned by the `WeakSet`, so the sets can be iterated
+    # directly (`list()` to guard against mutation during iteration).
+    modules = list(self.modules)
 
     for old_module in modules:
       _update_old_module(old_module, new_module)
 
     # Update all objects
-    live_old_objects = collections.defaultdict(list)
-
+    obj_count = 0
     for name, new_obj in new_module.__dict__.items():
-      old_obj_refs = self.objs.get(name)
+      old_objs = self.objs.get(name)
 
-      if old_obj_refs is None:
+      if old_objs is None:
         continue
 
-      live_old_objects[name] = [r for ref in old_obj_refs if (r := ref())]
-
-      for old_obj in live_old_objects[name]:
+      for old_obj in list(old_objs):
         # TODO(epot): Support cycles
         updater.update(old_obj, new_obj)
+        obj_count += 1
 
     if verbose:
-      obj_count = lambda x: sum((len(l) for l in x.values()))
       print(
           f"Updated refs of module {new_module.__name__}. Updated"
-          f" {len(self.modules)} versions (retained {len(modules)}). Updated"
-          f" {obj_count(self.objs)} objects"
-          f" ({obj_count(live_old_objects)} retained)."
+          f" {len(modules)} versions. Updated {obj_count} objects."
       )
-    live_old_refs = collections.defaultdict(
-        list,
-        {
-            name: [weakref.ref(obj) for obj in objs]
-            for name, objs in live_old_objects.items()
-        },
-    )
-    return _ModuleRefs([weakref.ref(m) for m in modules], objs=live_old_refs)
+    return self
 
 
 class _InPlaceReloader:
@@ -310,7 +339,7 @@ def _update_old_modules(
 ) -> None:
   """Update all old modules."""
   # Don't spend time updating types that are already dead anyway.
-  gc.collect()
+  _maybe_collect(previous_modules)
 
   start_time = time.time()
 
@@ -336,6 +365,30 @@ def _update_old_modules(
     )
 
 
+# Above this many saved module versions, a young-generation collect before
+# the sweep is worth its cost (prunes freshly dropped module dicts).
+_GC_MODULE_THRESHOLD = 32
+
+
+def _maybe_collect(previous_modules: dict[str, _ModuleRefs]) -> None:
+  """Prune dead objects before the update, without a full-heap collect.
+
+  A full `gc.collect()` is multi-hundred-ms on notebooks with large heaps
+  (model weights, arrays,...) and runs on every auto-reload. A generation-0
+  collect is enough to drop the just-replaced module dicts; set
+  `ETILS_RELOAD_FULL_GC=1` to restore the previous full collection.
+
+  Args:
+    previous_modules: The saved module refs (used to size the decision).
+  """
+  if os.environ.get('ETILS_RELOAD_FULL_GC'):
+    gc.collect()
+    return
+  num_saved = sum(len(refs.modules) for refs in previous_modules.values())
+  if num_saved > _GC_MODULE_THRESHOLD:
+    gc.collect(0)
+
+
 def _update_old_module(
     old_module: types.ModuleType,
     new_module: types.ModuleType,
@@ -130,25 +130,109 @@ def norm(
     keepdims: bool = False,
 ) -> FloatArray['*d']:
   """Like `np.linalg.norm` but auto-support jnp, tnp, np."""
-  if lazy.is_tf(x):  # TODO(b/219427516): tnp.linalg.norm missing
-    return lazy.tf.norm(x, axis=axis, keepdims=keepdims)
-  xnp = lazy.get_xnp(x)
-  return xnp.linalg.norm(x, axis=axis, keepdims=keepdims)
+  kind, module = _dispatch(x)
+  if kind == 'tf':  # TODO(b/219427516): tnp.linalg.norm missing
+    return module.norm(x, axis=axis, keepdims=keepdims)
+  if kind == 'jax':
+    return _jax_norm_fn(axis, keepdims)(x)
+  if (
+      module is np
+      and isinstance(axis, int)
+      and axis in (-1, x.ndim - 1)
+      and np.issubdtype(x.dtype, np.floating)
+  ):
+    # Last-axis L2 norm of real vectors: a single dot-product contraction
+    # (dispatched to BLAS) instead of `np.linalg.norm`'s generic reduction
+    # with its intermediate `x * x` temporary.
+    out = np.sqrt(np.einsum('...i,...i->...', x, x))
+    if keepdims:
+      out = np.expand_dims(out, axis=-1)
+    return out
+  return module.linalg.norm(x, axis=axis, keepdims=keepdims)
 
 
 def inv(x: FloatArray['*d']) -> FloatArray['*d']:
-  """Like `np.linalg.inv` but auto-support jnp, tnp, np."""
-  return _tf_or_xnp(x).linalg.inv(x)
+  """Like `np.linalg.inv` but auto-support jnp, tnp, np.
+
+  Leading batch dimensions are supported natively by every backend
+  (`x.shape == (*batch, m, m)`): stack many small matrices and make a
+  single call rather than looping, which pays the Python and backend
+  dispatch overhead once per matrix.
+
+  Args:
+    x: The (batch of) matrices to invert.
+
+  Returns:
+    The inverted matrices.
+  """
+  kind, module = _dispatch(x)
+  if kind == 'jax':
+    return _jax_linalg_fn('inv')(x)
+  return module.linalg.inv(x)
 
 
 def det(x: FloatArray['*d m m']) -> FloatArray['*d']:
-  """Like `np.linalg.det` but auto-support jnp, tnp, np."""
-  return _tf_or_xnp(x).linalg.det(x)
+  """Like `np.linalg.det` but auto-support jnp, tnp, np.
+
+  As with `inv`, leading batch dimensions are computed in one backend
+  call; prefer stacking small matrices over a Python loop.
+
+  Args:
+    x: The (batch of) matrices.
+
+  Returns:
+    The determinant of each matrix.
+  """
+  kind, module = _dispatch(x)
+  if kind == 'jax':
+    return _jax_linalg_fn('det')(x)
+  return module.linalg.det(x)
+
+
+@functools.lru_cache(maxsize=None)
+def _jax_norm_fn(axis, keepdims):
+  """Jitted `jnp.linalg.norm` (one compilation per `(axis, keepdims)`)."""
+  jnp = lazy.jnp
+  return lazy.jax.jit(
+      lambda x: jnp.linalg.norm(x, axis=axis, keepdims=keepdims)
+  )
+
+
+@functools.lru_cache(maxsize=None)
+def _jax_linalg_fn(name: str):
+  """Jitted `jnp.linalg.<name>` (cached so repeat calls skip tracing)."""
+  return lazy.jax.jit(getattr(lazy.jnp.linalg, name))
+
+
+# `type(x) -> (kind, module)` memo: the `lazy` isinstance chains dominate
+# small-array calls, so repeated calls with the same array class resolve
+# through a single dict lookup.
+_DISPATCH_BY_TYPE: dict[type, tuple[str, Any]] = {}
+
+
+def _dispatch(x: Array['*d']) -> tuple[str, Any]:
+  """Returns `(kind, module)` for the given array, cached per array type.
+
+  `kind` is `'tf'`, `'jax'` or `'xnp'` (numpy, torch,...); the module is
+  `tf` for TF arrays and the `get_xnp` module otherwise.
+
+  Args:
+    x: The array to dispatch on.
+
+  Returns:
+    The cached `(kind, module)` pair.
+  """
+  entry = _DISPATCH_BY_TYPE.get(type(x))
+  if entry is None:
+    if lazy.is_tf(x):
+      entry = ('tf', lazy.tf)
+    elif lazy.is_jax(x):
+      entry = ('jax', lazy.jnp)
+    else:
+      entry = ('xnp', lazy.get_xnp(x))
+    _DISPATCH_BY_TYPE[type(x)] = entry
+  return entry
 
 
 def _tf_or_xnp(x: Array['*d']):
-  xnp = lazy.get_xnp(x)
-  if lazy.has_tf and xnp is lazy.tnp:
-    return lazy.tf
-  else:
-    return xnp
+  return _dispatch(x)[1]
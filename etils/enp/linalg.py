@@ -16,13 +16,152 @@
 
 from __future__ import annotations
 
+import functools
+import sys
+from typing import Callable
+
 from etils.enp import compat
 from etils.enp import numpy_utils
 from etils.enp.typing import FloatArray  # pylint: disable=g-multiple-import
+import numpy as np
 
 lazy = numpy_utils.lazy
 
+# `type(x) -> kernel` memo: the backend is resolved through the `lazy`
+# isinstance chains only on the first call per array type; repeats pay a
+# single dict lookup.
+_NORMALIZE_FNS: dict[type, Callable[..., FloatArray]] = {}
+
+
+def normalize(
+    x: FloatArray['*d'],
+    axis: int = -1,
+    *,
+    out: FloatArray['*d'] | None = None,
+) -> FloatArray['*d']:
+  """Normalize the vector to the unit norm.
+
+  Args:
+    x: The vector(s) to normalize.
+    axis: Axis along which the norm is computed.
+    out: Optional pre-allocated output buffer (numpy only: jax/tf arrays
+      are immutable). Lets hot loops reuse a buffer instead of allocating
+      a new array per call.
+
+  Returns:
+    The normalized vector(s) (`out` when provided).
+  """
+  fn = _NORMALIZE_FNS.get(type(x))
+  if fn is None:
+    fn = _NORMALIZE_FNS[type(x)] = _resolve_normalize_fn(x)
+  if out is None:
+    return fn(x, axis)
+  if fn is not _np_normalize:
+    raise ValueError(
+        f'`out=` is only supported for numpy arrays. Got: {type(x)}'
+    )
+  return _np_normalize(x, axis, out=out)
+
+
+def _resolve_normalize_fn(x: FloatArray['*d']) -> Callable[..., FloatArray]:
+  """Returns the fused kernel for the array's backend.
+
+  `normalize` is memory-bound, so each backend is routed to a fused
+  reduce + rescale kernel rather than the generic `x / norm(x)` (which
+  re-reads `x` and pays `np.linalg.norm`'s overflow-protection scaling).
+
+  Args:
+    x: The array to dispatch on.
+
+  Returns:
+    The backend kernel, called as `fn(x, axis)`.
+  """
+  if lazy.is_tf(x):
+    return _tf_normalize
+  if lazy.is_jax(x):
+    return lambda x, axis: _jax_normalize(axis)(x)
+  if lazy.is_np(x):
+    return _np_normalize
+  return _generic_normalize
+
+
+def _tf_normalize(x: FloatArray['*d'], axis: int) -> FloatArray['*d']:
+  tf = lazy.tf
+  if x.dtype.is_complex:
+    # `square` is x², not |x|²: complex inputs need the conjugate, which
+    # `tf.norm` handles.
+    return _generic_normalize(x, axis)
+  sq = tf.reduce_sum(tf.square(x), axis=axis, keepdims=True)
+  return x * tf.math.rsqrt(sq)
 
-def normalize(x: FloatArray['*d'], axis: int = -1) -> FloatArray['*d']:
-  """Normalize the vector to the unit norm."""
+
+def _np_normalize(
+    x: FloatArray['*d'],
+    axis: int,
+    out: FloatArray['*d'] | None = None,
+) -> FloatArray['*d']:
+  if not np.issubdtype(x.dtype, np.floating):
+    # `square` is x², not |x|²: complex inputs need the conjugate, which
+    # `np.linalg.norm` handles.
+    return np.divide(x, np.linalg.norm(x, axis=axis, keepdims=True), out=out)
+  # Batched 2d case: the single-pass numba kernel avoids numpy's
+  # materialized `square` / `sum` intermediates. Only used when the user
+  # already imported numba (mirroring `lazy.has_...`: enp never triggers
+  # the import itself).
+  if (
+      'numba' in sys.modules
+      and x.ndim == 2
+      and axis in (-1, 1)
+      and x.dtype.type in (np.float32, np.float64)
+      and (kernel := _numba_normalize_last_axis()) is not None
+  ):
+    if out is None:
+      out = np.empty_like(x)
+    kernel(x, out)
+    return out
+  sq = np.sum(np.square(x), axis=axis, keepdims=True)
+  # Reciprocal-sqrt then multiply: one division per norm (on the small
+  # reduced array) instead of one per element of `x`.
+  inv = np.sqrt(sq)
+  np.reciprocal(inv, out=inv)
+  return np.multiply(x, inv, out=out)
+
+
+def _generic_normalize(x: FloatArray['*d'], axis: int) -> FloatArray['*d']:
   return x / compat.norm(x, axis=axis, keepdims=True)
+
+
+@functools.cache
+def _numba_normalize_last_axis() -> Callable[..., None] | None:
+  """Returns the jitted single-pass `(x, out)` 2d kernel (or `None`)."""
+  try:
+    import numba  # pylint: disable=g-import-not-at-top
+  except ImportError:
+    return None
+
+  @numba.njit(parallel=True, fastmath=True)
+  def _normalize_last_axis(x, out):
+    # Reduction, rsqrt and rescale fused in one traversal of each row.
+    for i in numba.prange(x.shape[0]):  # pylint: disable=not-an-iterable
+      sq = 0.0
+      for j in range(x.shape[1]):
+        sq += x[i, j] * x[i, j]
+      inv = 1.0 / np.sqrt(sq)
+      for j in range(x.shape[1]):
+        out[i, j] = x[i, j] * inv
+
+  return _normalize_last_axis
+
+
+@functools.lru_cache(maxsize=None)
+def _jax_normalize(axis: int):
+  """Returns the jitted normalize kernel for the given `axis`."""
+  jax = lazy.jax
+  jnp = lazy.jnp
+
+  @jax.jit
+  def _normalize(x):
+    # XLA fuses the reduction, rsqrt and multiply into a single kernel.
+    return x / jnp.linalg.norm(x, axis=axis, keepdims=True)
+
+  return _normalize
@@ -17,6 +17,7 @@
 from etils import enp
 
 import numpy as np
+import pytest
 
 enable_tf_np_mode = enp.testing.set_tnp
 
@@ -53,6 +54,39 @@ def test_normalize_batched(xnp: enp.NpModule):
   )
 
 
+# Ordering matters: the `False` case runs before numba is pulled into
+# `sys.modules`, covering the pure-numpy kernel; the `True` case imports
+# numba (or skips if not installed) and covers the fused kernel.
+@pytest.mark.parametrize('with_numba', [False, True])
+def test_normalize_out(with_numba: bool):
+  if with_numba:
+    pytest.importorskip('numba')
+  x = np.asarray(
+      [
+          [3.0, 0, 0],
+          [0, 4.0, 0],
+      ]
+  )
+  expected = [
+      [1.0, 0, 0],
+      [0, 1.0, 0],
+  ]
+  np.testing.assert_allclose(enp.linalg.normalize(x), expected)
+
+  # The provided buffer is written in-place and returned
+  out = np.empty_like(x)
+  y = enp.linalg.normalize(x, out=out)
+  assert y is out
+  np.testing.assert_allclose(out, expected)
+
+
+@enp.testing.parametrize_xnp(skip=['np'])
+def test_normalize_out_requires_np(xnp: enp.NpModule):
+  x = xnp.asarray([3.0, 0, 0])
+  with pytest.raises(ValueError, match='only supported for numpy'):
+    enp.linalg.normalize(x, out=np.empty((3,)))
+
+
 @enp.testing.parametrize_xnp()
 def test_norm(xnp: enp.NpModule):
   x = xnp.asarray([3.0, 0, 0])
@@ -23,6 +23,7 @@ import inspect
 import reprlib
 import sys
 import textwrap
+import weakref
 from typing import Any, Iterable, Iterator, Union
 
 from etils.epy import py_utils
@@ -276,14 +277,11 @@ def pretty_repr_top_level(obj: Any, *, force: bool = False) -> str:
         equal=': ',
     )
   elif _is_datclass(obj, force=force):
-    all_fields = dataclasses.fields(obj)
-
     return Lines.make_block(
         header=obj.__class__.__name__,
         content={
-            field.name: getattr(obj, field.name)
-            for field in all_fields
-            if field.repr
+            field_name: getattr(obj, field_name)
+            for field_name in _dataclass_repr_field_names(type(obj))
         },
     )
   elif _is_attr(obj, force=force):
@@ -316,6 +314,35 @@ def has_default_repr(cls: Any) -> bool:
   return repr_fn.__qualname__ == '__create_fn__.<locals>.__repr__'
 
 
+# Weakly keyed: `ecolab` reloads create a fresh class object per cell, and a
+# strong cache key would pin every old class version (and, through its
+# methods' `__globals__`, its whole old module namespace) forever.
+_REPR_FIELD_NAMES: weakref.WeakKeyDictionary[type[Any], tuple[str, ...]] = (
+    weakref.WeakKeyDictionary()
+)
+
+
+def _dataclass_repr_field_names(cls: type[Any]) -> tuple[str, ...]:
+  """Returns the repr-eligible field names (cached per class).
+
+  `__repr__` can be called thousands of times per second (debuggers,
+  logging,...) and `dataclasses.fields` re-materializes the field tuple on
+  each call, while the answer never changes for a given class.
+
+  Args:
+    cls: The dataclass type.
+
+  Returns:
+    The names of the fields with `repr=True`.
+  """
+  names = _REPR_FIELD_NAMES.get(cls)
+  if names is None:
+    names = _REPR_FIELD_NAMES[cls] = tuple(
+        f.name for f in dataclasses.fields(cls) if f.repr
+    )
+  return names
+
+
 def _is_datclass(obj: Any, *, force: bool = False) -> bool:
   """Returns `True` if the object is a dataclass."""
   if isinstance(obj, type):  # Class are not pretty-print
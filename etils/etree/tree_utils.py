@@ -16,10 +16,11 @@
 
 import concurrent.futures
 import functools
+import os
+import threading
 from typing import Any, Callable, Iterable, Iterator, Optional, TypeVar
 
 from etils import enp
-from etils import etqdm
 from etils.array_types import Array
 from etils.etree import backend as backend_lib
 from etils.etree.typing import LeafFn, Tree  # pylint: disable=g-importing-member,g-multiple-import
@@ -28,12 +29,50 @@ _T = Any  # TODO(pytype): Replace by `TypeVar`
 _Tin = Any  # Could make this TypeVar if typing support variadic
 _Tout = TypeVar('_Tout')
 
+# Tracks whether the current thread is already a `parallel_map` worker (to
+# run nested calls inline rather than dead-locking on the shared pool).
+_thread_state = threading.local()
+
+
+@functools.cache
+def _get_executor(
+    num_threads: Optional[int],
+) -> concurrent.futures.ThreadPoolExecutor:
+  """Returns the shared executor for the given thread count.
+
+  Executors are created lazily and reused across `parallel_map` calls, so
+  repeated maps on small trees do not pay thread spawn/teardown each time.
+
+  Args:
+    num_threads: Number of workers (default to CPU count * 5)
+
+  Returns:
+    The cached executor.
+  """
+  if num_threads is None:
+    num_threads = (os.cpu_count() or 1) * 5
+  return concurrent.futures.ThreadPoolExecutor(
+      max_workers=num_threads,
+      thread_name_prefix='etree_parallel_map',
+  )
+
 
 class TreeAPI:
-  """Tree API, using either `jax.tree_utils`, `tf.nest` or `tree` backend."""
+  """Tree API, using either `jax.tree_utils`, `tf.nest` or `tree` backend.
+
+  Note: The `jax` and `optree` backends implement the tree traversal in
+  C++ (pybind11), so for deep or wide pytrees `etree.jax` / `etree.optree`
+  are markedly faster than the pure-Python `tree` / `tf.nest` walks and
+  should be preferred when the dependency is available.
+  """
 
   def __init__(self, backend: backend_lib.Backend):
     self.backend = backend
+    # Prebound for the hot paths: a single attribute load instead of the
+    # `self.backend.<method>` chain on every call.
+    self._flatten = backend.flatten
+    self._map = backend.map
+    self._unflatten = backend.unflatten
 
   def map(
       self,
@@ -73,26 +112,73 @@ class TreeAPI:
     Returns:
       The nested structure after `map_fn` has been applied.
     """
-    # TODO(epot): Allow nesting `parallel_map` while keeping max num threads
-    # constant. How to avoid dead locks ?
-
-    with concurrent.futures.ThreadPoolExecutor(
-        max_workers=num_threads
-    ) as executor:
-      launch_worker = functools.partial(executor.submit, map_fn)
-      futures = self.backend.map(launch_worker, *trees, is_leaf=is_leaf)
-
-      leaves, _ = self.backend.flatten(futures, is_leaf=is_leaf)
-
-      itr = concurrent.futures.as_completed(leaves)
-      if progress_bar:
-        itr = etqdm.tqdm(itr, total=len(leaves))
-
+    # Nested `parallel_map` (a `map_fn` mapping a sub-tree) runs inline:
+    # submitting from a worker back to the shared pool could dead-lock.
+    if getattr(_thread_state, 'is_worker', False):
+      return self._map(map_fn, *trees, is_leaf=is_leaf)
+
+    # Each tree is flattened exactly once and all work happens on flat leaf
+    # lists; the structure is only rebuilt once at return time. (The previous
+    # implementation walked the structure three times: map to submit, flatten
+    # the futures tree, map again to collect the results.)
+    leaves, treedef = self._flatten(trees[0], is_leaf=is_leaf)
+
+    # Parallelism cannot help on single-leaf trees (or an explicit single
+    # worker): run inline and skip the executor/future machinery entirely.
+    if len(leaves) <= 1 or num_threads == 1:
+      return self._map(map_fn, *trees, is_leaf=is_leaf)
+
+    def _worker_fn(*values):
+      _thread_state.is_worker = True
+      try:
+        return map_fn(*values)
+      finally:
+        _thread_state.is_worker = False
+
+    leaves_per_tree = [leaves] + [
+        self._flatten(tree, is_leaf=is_leaf)[0] for tree in trees[1:]
+    ]
+
+    submit = _get_executor(num_threads).submit
+    # `strict=True` to catch trees with mismatched leaf counts (the full
+    # structure check previously done by `backend.map`).
+    futures = [
+        submit(_worker_fn, *values)
+        for values in zip(*leaves_per_tree, strict=True)
+    ]
+
+    if progress_bar:
+      # Imported here so `etree` does not pay the tqdm/absl import cost when
+      # no progress bar is requested (the steady-state case).
+      from etils import etqdm  # pylint: disable=g-import-not-at-top
+
+      itr = etqdm.tqdm(
+          concurrent.futures.as_completed(futures), total=len(futures)
+      )
       for f in itr:  # Propagate exception to main thread.
-        if f.exception():
-          raise f.exception()
-
-    return self.backend.map(lambda f: f.result(), futures)
+        # `.exception()` acquires the future's condition lock: call it once.
+        if (exc := f.exception()) is not None:
+          # Not-yet-started leaves are dropped from the queue rather than
+          # executed for a result nobody will collect.
+          for pending in futures:
+            pending.cancel()
+          raise exc
+    else:
+      # Without a progress bar this is just "wait for all, surface the first
+      # error", so a single wait() avoids as_completed's per-future queue
+      # machinery.
+      done, not_done = concurrent.futures.wait(
+          futures, return_when=concurrent.futures.FIRST_EXCEPTION
+      )
+      for f in done:  # Propagate exception to main thread.
+        if (exc := f.exception()) is not None:
+          # Not-yet-started leaves are dropped from the queue rather than
+          # executed for a result nobody will collect.
+          for pending in not_done:
+            pending.cancel()
+          raise exc
+
+    return self._unflatten(treedef, [f.result() for f in futures])
 
   def unzip(self, tree: Tree[Iterable[_T]]) -> Iterator[Tree[_T]]:
     """Unpack a tree of iterable.
@@ -111,9 +197,20 @@ class TreeAPI:
     Yields:
       Trees of same structure than the input, but with individual elements.
     """
-    leaves, treedef = self.backend.flatten(tree)
-    for leaf_elems in zip(*leaves):  # TODO(py310): check=True
-      yield self.backend.unflatten(treedef, leaf_elems)
+    leaves, treedef = self._flatten(tree)
+    if (
+        leaves
+        and all(enp.lazy.is_array(leaf) for leaf in leaves)
+        and all(getattr(leaf, 'ndim', 0) >= 1 for leaf in leaves)
+        and len({leaf.shape[0] for leaf in leaves}) == 1
+    ):
+      # Array leaves: integer indexing yields cheap array views instead of
+      # driving every element through the Python iterator protocol.
+      for i in range(leaves[0].shape[0]):
+        yield self._unflatten(treedef, [leaf[i] for leaf in leaves])
+    else:
+      for leaf_elems in zip(*leaves):  # TODO(py310): check=True
+        yield self._unflatten(treedef, leaf_elems)
 
   def stack(
       self, trees: Iterable[Tree[Array['*s']]]